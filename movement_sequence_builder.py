@@ -9,8 +9,39 @@ No PID controllers, no external math libraries.
 """
 
 from pitop.robotics import DriveController
+import argparse
+import json
+import math
+import os
+import sys
+import termios
 import time
 
+# ============================================================================
+# CONSTANTS
+# ============================================================================
+
+_IN2M = 0.0254                      # meters per inch
+_DEG2RAD = 0.017453292519943295     # radians per degree (pi / 180)
+
+# Minimum time from issuing a drive command until the motors are stopped
+_SETTLE_SECONDS = 0.5
+
+# Core and SCHED_FIFO priority used while a motor command is in flight
+_RT_CPU = 1
+_RT_PRIORITY = 80
+
+# Fixed console text, built once instead of on every use
+_BANNER = "=" * 60
+_HEADER = (
+    f"{_BANNER}\n"
+    "  PI-TOP PRECISION MOVEMENT CONTROLLER\n"
+    f"{_BANNER}\n"
+    "  Use inches for distance, degrees for rotation\n"
+    "  Type 'exit' at any time to quit\n\n"
+)
+_MOVEMENT_PROMPT = "\nMovement type (Forward/Backward/Rotate) or 'exit': "
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
@@ -25,7 +56,7 @@ def inches_to_meters(inches):
     Returns:
         float: Distance in meters
     """
-    return inches * 0.0254
+    return inches * _IN2M
 
 
 def degrees_to_radians(degrees):
@@ -38,7 +69,7 @@ def degrees_to_radians(degrees):
     Returns:
         float: Angle in radians
     """
-    return degrees * (3.141592653589793 / 180.0)
+    return degrees * _DEG2RAD
 
 
 def percent_to_speed_factor(percent):
@@ -56,6 +87,58 @@ def percent_to_speed_factor(percent):
     return clamped / 100.0
 
 
+def wait_until(deadline):
+    """
+    Sleep until a time.monotonic() deadline, returning at once if it has passed.
+    
+    Args:
+        deadline (float): Target time on the time.monotonic() clock
+    """
+    remaining = deadline - time.monotonic()
+    if remaining > 0:
+        time.sleep(remaining)
+
+
+def flush_pending_input():
+    """
+    Discard keystrokes typed before the program was ready for them.
+    
+    Only terminal input is flushed; piped input is a script of answers.
+    """
+    if not sys.stdin.isatty():
+        return
+    try:
+        termios.tcflush(sys.stdin, termios.TCIFLUSH)
+    except termios.error:
+        pass
+
+
+def read_input(prompt):
+    """
+    Prompt the user and read one line of input.
+    
+    Stale terminal input is flushed before the prompt is shown, and end
+    of input is reported as None rather than raising EOFError.
+    
+    Args:
+        prompt (str): The prompt to display
+        
+    Returns:
+        str: The line entered, without the trailing newline, or None if
+            stdin has been closed (e.g. Ctrl-D)
+    """
+    # Lines typed while the robot was busy were meant for earlier prompts
+    flush_pending_input()
+    
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    
+    line = sys.stdin.readline()
+    if not line:
+        return None
+    return line.rstrip("\n")
+
+
 def get_positive_number(prompt, unit=""):
     """
     Get a positive number from user input with validation.
@@ -72,10 +155,10 @@ def get_positive_number(prompt, unit=""):
     """
     while True:
         try:
-            user_input = input(f"{prompt} ({unit}): ").strip()
+            user_input = read_input(f"{prompt} ({unit}): ")
             
             # Allow user to escape
-            if user_input.lower() == "exit":
+            if user_input is None or user_input.strip().lower() == "exit":
                 return None
                 
             value = float(user_input)
@@ -96,9 +179,9 @@ def get_speed_percent():
     """
     while True:
         try:
-            user_input = input("Speed (0-100, %): ").strip()
+            user_input = read_input("Speed (0-100, %): ")
             
-            if user_input.lower() == "exit":
+            if user_input is None or user_input.strip().lower() == "exit":
                 return None
                 
             value = float(user_input)
@@ -117,41 +200,67 @@ def get_movement_type():
     Returns:
         str: "forward", "backward", "rotate", or None to exit
     """
-    valid_types = ["forward", "backward", "rotate", "exit"]
-    
     while True:
-        user_input = input("\nMovement type (Forward/Backward/Rotate) or 'exit': ").strip().lower()
+        user_input = read_input(_MOVEMENT_PROMPT)
+        if user_input is None:
+            return None
+        user_input = user_input.strip().lower()
         
-        if user_input in valid_types:
-            return user_input if user_input != "exit" else None
+        if user_input in _MOVEMENTS:
+            return user_input
+        elif user_input == "exit":
+            return None
         else:
             print("  ⚠ Valid options: Forward, Backward, Rotate, or exit")
 
 
-def move_forward(drive, speed_percent, distance_inches):
+def _move_linear(drive, drive_method, direction, speed_percent, distance_inches):
     """
-    Move the robot forward by a specified distance.
+    Drive the robot in a straight line by a specified distance.
     
     Args:
         drive (DriveController): The drive controller instance
+        drive_method (callable): drive.forward or drive.backward
+        direction (str): "forward" or "backward", used in messages
         speed_percent (float): Speed as percentage (0-100)
         distance_inches (float): Distance in inches
+        
+    Returns:
+        bool: True if the movement completed without a drive error
     """
     speed_factor = percent_to_speed_factor(speed_percent)
     distance_meters = inches_to_meters(distance_inches)
     
-    print(f"\n➜ Moving forward {distance_inches} inches at {speed_percent}% speed...")
+    print(f"\n➜ Moving {direction} {distance_inches} inches at {speed_percent}% speed...")
     
     try:
-        drive.forward(speed_factor, distance=distance_meters)
-        print(f"✓ Movement complete")
-        time.sleep(0.5)
+        deadline = time.monotonic() + _SETTLE_SECONDS
+        drive_method(speed_factor, distance=distance_meters)
+        print("✓ Movement complete")
+        wait_until(deadline)
+        return True
     except Exception as e:
-        print(f"✗ Error during forward movement: {e}")
+        print(f"✗ Error during {direction} movement: {e}")
+        return False
     finally:
         drive.stop()
 
 
+def move_forward(drive, speed_percent, distance_inches):
+    """
+    Move the robot forward by a specified distance.
+    
+    Args:
+        drive (DriveController): The drive controller instance
+        speed_percent (float): Speed as percentage (0-100)
+        distance_inches (float): Distance in inches
+        
+    Returns:
+        bool: True if the movement completed without a drive error
+    """
+    return _move_linear(drive, drive.forward, "forward", speed_percent, distance_inches)
+
+
 def move_backward(drive, speed_percent, distance_inches):
     """
     Move the robot backward by a specified distance.
@@ -160,20 +269,11 @@ def move_backward(drive, speed_percent, distance_inches):
         drive (DriveController): The drive controller instance
         speed_percent (float): Speed as percentage (0-100)
         distance_inches (float): Distance in inches
+        
+    Returns:
+        bool: True if the movement completed without a drive error
     """
-    speed_factor = percent_to_speed_factor(speed_percent)
-    distance_meters = inches_to_meters(distance_inches)
-    
-    print(f"\n➜ Moving backward {distance_inches} inches at {speed_percent}% speed...")
-    
-    try:
-        drive.backward(speed_factor, distance=distance_meters)
-        print(f"✓ Movement complete")
-        time.sleep(0.5)
-    except Exception as e:
-        print(f"✗ Error during backward movement: {e}")
-    finally:
-        drive.stop()
+    return _move_linear(drive, drive.backward, "backward", speed_percent, distance_inches)
 
 
 def rotate_in_place(drive, speed_percent, angle_degrees):
@@ -184,6 +284,9 @@ def rotate_in_place(drive, speed_percent, angle_degrees):
         drive (DriveController): The drive controller instance
         speed_percent (float): Speed as percentage (0-100)
         angle_degrees (float): Angle in degrees
+        
+    Returns:
+        bool: True if the rotation completed without a drive error
     """
     speed_factor = percent_to_speed_factor(speed_percent)
     angle_radians = degrees_to_radians(angle_degrees)
@@ -191,15 +294,174 @@ def rotate_in_place(drive, speed_percent, angle_degrees):
     print(f"\n➜ Rotating {angle_degrees} degrees at {speed_percent}% speed...")
     
     try:
+        deadline = time.monotonic() + _SETTLE_SECONDS
         drive.rotate(angle_radians, max_speed_factor=speed_factor)
-        print(f"✓ Rotation complete")
-        time.sleep(0.5)
+        print("✓ Rotation complete")
+        wait_until(deadline)
+        return True
     except Exception as e:
         print(f"✗ Error during rotation: {e}")
+        return False
     finally:
         drive.stop()
 
 
+def enter_realtime():
+    """
+    Pin the process to one core and switch it to SCHED_FIFO.
+    
+    Keeps other processes from delaying motor commands. Raising the
+    priority needs root, or an rtprio entry for the user in
+    /etc/security/limits.conf; without either, the process simply keeps
+    its normal priority.
+    
+    Returns:
+        tuple: (previous CPU affinity, previous (policy, sched_param)),
+            each None if that setting was not changed
+    """
+    previous_cpus = None
+    try:
+        cpus = os.sched_getaffinity(0)
+        if _RT_CPU in cpus:
+            os.sched_setaffinity(0, {_RT_CPU})
+            previous_cpus = cpus
+    except (AttributeError, OSError):
+        pass
+    
+    previous_sched = None
+    try:
+        sched = (os.sched_getscheduler(0), os.sched_getparam(0))
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(_RT_PRIORITY))
+        previous_sched = sched
+    except (AttributeError, OSError):
+        pass
+    
+    return previous_cpus, previous_sched
+
+
+def exit_realtime(previous):
+    """
+    Undo enter_realtime(), restoring only the settings it changed.
+    
+    Args:
+        previous (tuple): The value returned by enter_realtime()
+    """
+    previous_cpus, previous_sched = previous
+    
+    if previous_sched is not None:
+        try:
+            os.sched_setscheduler(0, *previous_sched)
+        except OSError:
+            pass
+    
+    if previous_cpus is not None:
+        try:
+            os.sched_setaffinity(0, previous_cpus)
+        except OSError:
+            pass
+
+
+# Movement type -> (handler, amount prompt, amount unit)
+_MOVEMENTS = {
+    "forward": (move_forward, "Distance", "inches"),
+    "backward": (move_backward, "Distance", "inches"),
+    "rotate": (rotate_in_place, "Angle", "degrees"),
+}
+
+
+def run_movement(drive, movement, speed_percent, amount):
+    """
+    Carry out one movement at real-time priority.
+    
+    Args:
+        drive (DriveController): The drive controller instance
+        movement (str): "forward", "backward", or "rotate"
+        speed_percent (float): Speed as percentage (0-100)
+        amount (float): Distance in inches, or angle in degrees for rotate
+        
+    Returns:
+        bool: True if the movement completed without a drive error
+    """
+    move = _MOVEMENTS[movement][0]
+    
+    previous = enter_realtime()
+    try:
+        return move(drive, speed_percent, amount)
+    finally:
+        exit_realtime(previous)
+
+
+def load_movements(path):
+    """
+    Load a movement list previously written by save_movements().
+    
+    Args:
+        path (str): Path to the JSON file
+        
+    Returns:
+        list: Movements as [movement, speed_percent, amount] lists, with
+            both numbers as floats
+        
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not a valid movement list
+    """
+    with open(path) as f:
+        movements = json.load(f)
+    
+    if not isinstance(movements, list):
+        raise ValueError("expected a list of movements")
+    
+    loaded = []
+    for entry in movements:
+        if (not isinstance(entry, list) or len(entry) != 3
+                or not isinstance(entry[0], str) or entry[0] not in _MOVEMENTS
+                or not all(type(n) in (int, float) for n in entry[1:])):
+            raise ValueError(f"invalid movement entry: {entry!r}")
+        
+        try:
+            speed, amount = float(entry[1]), float(entry[2])
+        except OverflowError:
+            raise ValueError(f"number too large in movement entry: {entry!r}")
+        if not (math.isfinite(speed) and math.isfinite(amount)):
+            raise ValueError(f"invalid movement entry: {entry!r}")
+        if not 0 <= speed <= 100 or amount <= 0:
+            raise ValueError(f"speed or amount out of range: {entry!r}")
+        
+        loaded.append([entry[0], speed, amount])
+    return loaded
+
+
+def save_movements(path, movements):
+    """
+    Write a movement list so it can be replayed with --load.
+    
+    Args:
+        path (str): Path to the JSON file
+        movements (list): Movements as [movement, speed_percent, amount] lists
+        
+    Raises:
+        OSError: If the file cannot be written
+    """
+    with open(path, "w") as f:
+        json.dump(movements, f, indent=2)
+
+
+def parse_args():
+    """
+    Parse command-line options.
+    
+    Returns:
+        argparse.Namespace: Parsed options (load, save)
+    """
+    parser = argparse.ArgumentParser(description="Pi-Top precision movement controller")
+    parser.add_argument("--load", metavar="PATH",
+                        help="replay movements saved by a previous --save run")
+    parser.add_argument("--save", metavar="PATH",
+                        help="save this session's movements to PATH on exit")
+    return parser.parse_args()
+
+
 # ============================================================================
 # MAIN PROGRAM
 # ============================================================================
@@ -208,23 +470,50 @@ def main():
     """
     Main control loop for the pi-top movement controller.
     """
-    print("=" * 60)
-    print("  PI-TOP PRECISION MOVEMENT CONTROLLER")
-    print("=" * 60)
-    print("  Use inches for distance, degrees for rotation")
-    print("  Type 'exit' at any time to quit\n")
+    args = parse_args()
+    sys.stdout.write(_HEADER)
+    
+    # Load saved movements before touching the hardware
+    loaded = []
+    if args.load:
+        try:
+            loaded = load_movements(args.load)
+        except (OSError, ValueError) as e:
+            print(f"✗ Failed to load movements from {args.load}: {e}")
+            return
     
     # Initialize the drive controller
     try:
         drive = DriveController()
         print("✓ Drive controller initialized\n")
     except Exception as e:
-        print(f"✗ Failed to initialize drive controller: {e}")
-        print("  Make sure the pi-top is powered on and connected.")
+        print(f"✗ Failed to initialize drive controller: {e}\n"
+              "  Make sure the pi-top is powered on and connected.")
         return
     
+    # Movements that completed this session, for --save
+    history = []
+    keep_running = True
+    
+    # Show loaded movements and only replay them once the user confirms
+    if loaded:
+        print(f"➜ Loaded {len(loaded)} movement(s) from {args.load}:")
+        for movement, speed, amount in loaded:
+            amount_unit = _MOVEMENTS[movement][2]
+            print(f"  {movement.capitalize()} {amount} {amount_unit} at {speed}% speed")
+        
+        answer = read_input("Replay these movements now? (yes/no): ")
+        if answer is None:
+            keep_running = False
+        elif answer.strip().lower() in ("yes", "y"):
+            for movement, speed, amount in loaded:
+                if run_movement(drive, movement, speed, amount):
+                    history.append([movement, speed, amount])
+        else:
+            print("  Replay skipped")
+    
     # Main control loop
-    while True:
+    while keep_running:
         # Get movement type from user
         movement = get_movement_type()
         if movement is None:
@@ -236,29 +525,26 @@ def main():
             break
         
         # Get distance or angle based on movement type
-        if movement in ["forward", "backward"]:
-            distance = get_positive_number("Distance", "inches")
-            if distance is None:
-                break
-            
-            if movement == "forward":
-                move_forward(drive, speed, distance)
-            else:
-                move_backward(drive, speed, distance)
+        amount_prompt, amount_unit = _MOVEMENTS[movement][1:]
+        amount = get_positive_number(amount_prompt, amount_unit)
+        if amount is None:
+            break
         
-        elif movement == "rotate":
-            angle = get_positive_number("Angle", "degrees")
-            if angle is None:
-                break
-            
-            rotate_in_place(drive, speed, angle)
+        if run_movement(drive, movement, speed, amount):
+            history.append([movement, speed, amount])
     
     # Cleanup on exit
-    print("\n" + "=" * 60)
-    print("  Shutting down...")
+    print(f"\n{_BANNER}\n  Shutting down...")
     drive.stop()
-    print("  ✓ Done. Goodbye!")
-    print("=" * 60)
+    
+    if args.save:
+        try:
+            save_movements(args.save, history)
+            print(f"  ✓ Saved {len(history)} movement(s) to {args.save}")
+        except OSError as e:
+            print(f"  ✗ Failed to save movements to {args.save}: {e}")
+    
+    print(f"  ✓ Done. Goodbye!\n{_BANNER}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,67 @@
+"""
+Tests for loading saved movement files.
+"""
+
+import json
+import sys
+import types
+
+import pytest
+
+# load_movements() never touches the hardware, so a placeholder is
+# enough to import the controller where pitop is not installed.
+try:
+    import pitop.robotics  # noqa: F401
+except ImportError:
+    _robotics = types.ModuleType("pitop.robotics")
+    _robotics.DriveController = object
+    sys.modules.setdefault("pitop", types.ModuleType("pitop"))
+    sys.modules.setdefault("pitop.robotics", _robotics)
+
+from movement_sequence_builder import load_movements, save_movements
+
+
+def write_json(tmp_path, text):
+    path = tmp_path / "moves.json"
+    path.write_text(text)
+    return str(path)
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / "moves.json")
+    save_movements(path, [["forward", 50.0, 12.0], ["rotate", 20.0, 90.0]])
+    assert load_movements(path) == [["forward", 50.0, 12.0], ["rotate", 20.0, 90.0]]
+
+
+def test_integers_are_loaded_as_floats(tmp_path):
+    path = write_json(tmp_path, '[["backward", 100, 3]]')
+    movements = load_movements(path)
+    assert movements == [["backward", 100.0, 3.0]]
+    assert all(type(n) is float for n in movements[0][1:])
+
+
+@pytest.mark.parametrize("text", [
+    '{"forward": [50, 10]}',
+    '[["forward", 50]]',
+    '[["sideways", 50, 10]]',
+    '[[["a"], 50, 10]]',
+    '[[{"a": 1}, 50, 10]]',
+    '[["forward", "50", 10]]',
+    '[["forward", true, 10]]',
+    '[["forward", 50, Infinity]]',
+    '[["forward", 50, NaN]]',
+    '[["forward", 50, 1e400]]',
+    '[["forward", 50, 1' + "0" * 400 + ']]',
+    '[["forward", 101, 10]]',
+    '[["forward", 50, 0]]',
+    'not json',
+])
+def test_invalid_files_raise_value_error(tmp_path, text):
+    path = write_json(tmp_path, text)
+    with pytest.raises(ValueError):
+        load_movements(path)
+
+
+def test_missing_file_raises_os_error(tmp_path):
+    with pytest.raises(OSError):
+        load_movements(str(tmp_path / "missing.json"))